@@ -0,0 +1,50 @@
+"""
+Fixtures for the backend tests.
+
+Each test module gets the app on a fresh SQLite database of its own (see
+``src/testbed.py``); a module sets ``BACKEND_ENV`` for extra configuration.
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "src"))
+
+import testbed  # noqa: E402
+
+# Default users are hashed at startup; full-cost bcrypt only slows the suite down
+os.environ.setdefault("BCRYPT_ROUNDS", "4")
+
+
+@pytest.fixture(scope="module")
+def backend(request):
+    environ = dict(os.environ)
+    yield testbed.load_backend("test", **getattr(request.module, "BACKEND_ENV", {}))
+    os.environ.clear()
+    os.environ.update(environ)
+
+
+@pytest.fixture(scope="module")
+def client(backend):
+    from fastapi.testclient import TestClient
+
+    with TestClient(backend.app) as client:
+        yield client
+
+
+@pytest.fixture(scope="module")
+def admin(client):
+    return testbed.auth_headers(client)
+
+
+@pytest.fixture(scope="module")
+def mentor(client):
+    return testbed.auth_headers(client, "mentor1", "mentor123")
+
+
+@pytest.fixture
+def centre(backend):
+    # Two fresh groups of three students with no coins, attendance or scores
+    return testbed.seed_centre(backend, 2, 3, coins=0)
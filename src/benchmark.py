@@ -0,0 +1,293 @@
+"""
+Benchmark suite for the FastAPI backend.
+
+Seeds a synthetic educational centre in a throwaway SQLite database (groups of
+students with years of attendance and weekly scores), then drives the login,
+list, search, top-students, dashboard and write endpoints through an in-process ASGI client and
+reports latency percentiles and throughput for each scenario.
+
+It also times cold starts: fresh interpreters importing the app and running
+its startup against the seeded database, checked against ``--cold-start-target-ms``.
+
+The report is written as JSON so runs can be compared across releases; pass
+an earlier report as ``--baseline`` to print the change per scenario.
+
+Usage:
+    python benchmark.py [--groups 40] [--students-per-group 25] [--years 1]
+                        [--requests 200] [--concurrency 10] [--mode sync|async]
+                        [--output benchmark.json] [--baseline previous.json]
+                        [--cold-start-target-ms 2000]
+"""
+
+import argparse
+import asyncio
+import datetime
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+
+import testbed
+
+LESSON_WEEKDAYS = (0, 2, 4)  # Mon/Wed/Fri
+FIRST_DAY = datetime.date(2022, 9, 1)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark the O'quv Markazi API")
+    parser.add_argument("--groups", type=int, default=40)
+    parser.add_argument("--students-per-group", type=int, default=25)
+    parser.add_argument("--years", type=float, default=1, help="years of attendance history to seed")
+    parser.add_argument("--requests", type=int, default=200, help="requests per scenario")
+    parser.add_argument("--login-requests", type=int, default=20, help="requests for the (bcrypt-bound) login scenario")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--mode", choices=["sync", "async"], default="sync")
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--output", default="benchmark.json")
+    parser.add_argument("--baseline", help="earlier report to compare against")
+    parser.add_argument("--cold-start-target-ms", type=float, default=2000,
+                        help="budget from launching a worker process to it being ready to serve")
+    return parser.parse_args()
+
+
+def lesson_days(years: float):
+    last_day = FIRST_DAY + datetime.timedelta(days=int(365 * years))
+    day = FIRST_DAY
+    while day < last_day:
+        if day.weekday() in LESSON_WEEKDAYS:
+            yield day
+        day += datetime.timedelta(days=1)
+
+
+def seed(backend, args) -> dict:
+    """Insert the synthetic centre and return the row counts."""
+    started = time.perf_counter()
+    days = list(lesson_days(args.years))
+    centre = testbed.seed_centre(
+        backend, args.groups, args.students_per_group,
+        days=days, score_days=[day for day in days if day.weekday() == LESSON_WEEKDAYS[-1]],
+        rng=random.Random(args.seed),
+    )
+    return {
+        "groups": len(centre["group_ids"]),
+        "students": len(centre["student_ids"]),
+        "attendance": centre["attendance"],
+        "scores": centre["scores"],
+        "last_day": days[-1].isoformat() if days else FIRST_DAY.isoformat(),
+        "seed_seconds": round(time.perf_counter() - started, 3),
+    }
+
+
+def percentile(sorted_values, fraction: float) -> float:
+    # Nearest-rank percentile
+    index = max(0, min(len(sorted_values) - 1, int(round(fraction * len(sorted_values) + 0.5)) - 1))
+    return sorted_values[index]
+
+
+async def run_scenario(client, request, count: int, concurrency: int) -> dict:
+    """Issue ``count`` requests built by ``request(i)`` with ``concurrency`` in flight."""
+    semaphore = asyncio.Semaphore(concurrency)
+    latencies = []
+    errors = 0
+
+    async def one(i):
+        nonlocal errors
+        async with semaphore:
+            method, url, kwargs = request(i)
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(i) for i in range(count)))
+    elapsed = time.perf_counter() - started
+    latencies.sort()
+    return {
+        "requests": count,
+        "errors": errors,
+        "throughput_rps": round(count / elapsed, 2),
+        "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p90_ms": round(percentile(latencies, 0.90) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "max_ms": round(latencies[-1] * 1000, 3),
+    }
+
+
+def scenarios(args, dataset, admin, mentor):
+    rng = random.Random(args.seed)
+    students = dataset["students"]
+    groups = dataset["groups"]
+    first_free_day = datetime.date.fromisoformat(dataset["last_day"]) + datetime.timedelta(days=1)
+    per_group = args.students_per_group
+
+    def roll_call(i):
+        group_id = i % groups + 1
+        day = first_free_day + datetime.timedelta(days=i // groups)
+        records = [
+            {"student_id": (group_id - 1) * per_group + j + 1, "present": rng.random() < 0.9}
+            for j in range(per_group)
+        ]
+        return "POST", "/api/attendance/bulk/", {"json": {"group_id": group_id, "date": day.isoformat(), "records": records}, "headers": admin}
+
+    def single_mark(i):
+        day = first_free_day + datetime.timedelta(days=1000 + i // students)
+        body = {"date": day.isoformat(), "present": True, "student_id": i % students + 1}
+        return "POST", "/api/attendance/", {"json": body, "headers": admin}
+
+    def add_score(i):
+        body = {"date": first_free_day.isoformat(), "value": rng.randint(1, 10), "student_id": rng.randint(1, students)}
+        return "POST", "/api/scores/", {"json": body, "params": {"coins": 1}, "headers": admin}
+
+    def bulk_scores(i):
+        group_id = i % groups + 1
+        records = [{"student_id": (group_id - 1) * per_group + j + 1, "value": rng.randint(1, 10), "coins": 1} for j in range(per_group)]
+        return "POST", "/api/scores/bulk/", {"json": {"date": first_free_day.isoformat(), "records": records}, "headers": admin}
+
+    def get(url, headers):
+        return lambda i: ("GET", url.format(group=i % groups + 1, student=i % students + 1), {"headers": headers})
+
+    login = lambda i: ("POST", "/api/auth/login/", {"json": {"username": "admin", "password": "admin123"}})
+    return [
+        ("login", login, args.login_requests),
+        ("list_groups", get("/api/group/?limit=20", admin), args.requests),
+        ("list_students", get("/api/student/?limit=100", admin), args.requests),
+        ("list_students_mentor", get("/api/student/?limit=100", mentor), args.requests),
+        ("student_detail", get("/api/student/{student}/", admin), args.requests),
+        ("search_students", get("/api/student/search/?q=Student+{group}", admin), args.requests),
+        ("attendance_by_group", get("/api/attendance/?group_id={group}&limit=500", admin), args.requests),
+        ("scores_page", get("/api/scores/?limit=100", admin), args.requests),
+        ("top_students", get("/api/student/top/?limit=10", admin), args.requests),
+        ("top_students_group", get("/api/student/top/?limit=10&group_id={group}", admin), args.requests),
+        ("attendance_stats_by_group", get("/api/analytics/attendance/?by=group", admin), args.requests),
+        ("dashboard", get("/api/dashboard/", admin), args.requests),
+        ("dashboard_mentor", get("/api/dashboard/", mentor), args.requests),
+        ("record_attendance", single_mark, args.requests),
+        ("record_attendance_bulk", roll_call, args.requests),
+        ("add_score", add_score, args.requests),
+        ("add_scores_bulk", bulk_scores, args.requests),
+    ]
+
+
+async def run(backend, args, dataset) -> dict:
+    import httpx
+
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        async def token(username, password):
+            response = await client.post("/api/auth/login/", json={"username": username, "password": password})
+            response.raise_for_status()
+            return {"Authorization": f"Bearer {response.json()['access']}"}
+
+        admin = await token("admin", "admin123")
+        mentor = await token("mentor1", "mentor123")
+        results = {}
+        for name, request, count in scenarios(args, dataset, admin, mentor):
+            results[name] = await run_scenario(client, request, count, args.concurrency)
+            result = results[name]
+            print(
+                f"{name:<27} {result['throughput_rps']:9.1f} req/s  p50 {result['p50_ms']:8.2f} ms  "
+                f"p90 {result['p90_ms']:8.2f} ms  p99 {result['p99_ms']:8.2f} ms  errors {result['errors']}"
+            )
+        return results
+
+
+def measure_cold_start(target_ms: float, runs: int = 3) -> dict:
+    """Best of ``runs`` fresh worker processes: launch to ready, and module load to ready."""
+    code = (
+        "import time; import FastAPI_Backend_Template as backend; backend.startup(); "
+        "print(time.perf_counter() - backend.MODULE_LOAD_STARTED)"
+    )
+    process = []
+    module = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        result = subprocess.run(
+            [sys.executable, "-W", "ignore", "-c", code], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        )
+        process.append(time.perf_counter() - started)
+        module.append(float(result.stdout.strip().splitlines()[-1]))
+    best = min(process) * 1000
+    return {
+        "process_to_ready_ms": round(best, 1),
+        "module_load_to_ready_ms": round(min(module) * 1000, 1),
+        "target_ms": target_ms,
+        "within_target": best <= target_ms,
+    }
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "describe", "--always", "--dirty"], capture_output=True, text=True, check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(report: dict, baseline: dict):
+    print(f"\nChange against {baseline['meta']['revision']} (throughput, p50 latency):")
+    for name, result in report["results"].items():
+        before = baseline.get("results", {}).get(name)
+        if not before:
+            continue
+        throughput = (result["throughput_rps"] / before["throughput_rps"] - 1) * 100
+        latency = (result["p50_ms"] / before["p50_ms"] - 1) * 100 if before["p50_ms"] else 0.0
+        print(f"{name:<27} {throughput:+7.1f}% req/s  {latency:+7.1f}% p50")
+    if "cold_start" in baseline:
+        before = baseline["cold_start"]["process_to_ready_ms"]
+        print(f"{'cold_start':<27} {(report['cold_start']['process_to_ready_ms'] / before - 1) * 100:+7.1f}% launch to ready")
+
+
+def main():
+    args = parse_args()
+    backend = testbed.load_backend("benchmark", args.mode)
+    dataset = seed(backend, args)
+    print(
+        f"seeded {dataset['groups']} groups, {dataset['students']} students, {dataset['attendance']} attendance "
+        f"and {dataset['scores']} score rows in {dataset['seed_seconds']} s"
+    )
+    results = asyncio.run(run(backend, args, dataset))
+    cold_start = measure_cold_start(args.cold_start_target_ms)
+    print(
+        f"{'cold_start':<27} {cold_start['process_to_ready_ms']:9.1f} ms launch to ready "
+        f"({cold_start['module_load_to_ready_ms']:.1f} ms in the app), target {args.cold_start_target_ms:.0f} ms"
+    )
+
+    report = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "db_mode": args.mode,
+            "sqlite_profile": backend.SQLITE_PROFILE,
+            "json_encoder": "orjson" if backend.orjson is not None else "json",
+            "bcrypt_rounds": backend.BCRYPT_ROUNDS,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+        },
+        "dataset": dataset,
+        "results": results,
+        "cold_start": cold_start,
+    }
+    with open(args.output, "w") as f:
+        json.dump(report, f, indent=2)
+    print(f"\nReport written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            compare(report, json.load(f))
+    if any(result["errors"] for result in results.values()) or not cold_start["within_target"]:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,7 @@
 import { useState, useEffect } from 'react';
 import { useAuth } from '@/context/AuthContext';
 import { useNavigate } from 'react-router-dom';
+import { getDashboard } from '@/lib/dataService';
 
 interface Stat {
   title: string;
@@ -10,7 +11,7 @@ interface Stat {
 }
 
 const CEODashboard = ({ stats: initialStats, onTabChange }: { stats: Stat[]; onTabChange: (tab: string) => void }) => {
-  const { apiRequest, user, tokens } = useAuth();
+  const { user, tokens } = useAuth();
   const [stats, setStats] = useState(initialStats);
   const navigate = useNavigate();
 
@@ -22,13 +23,12 @@ const CEODashboard = ({ stats: initialStats, onTabChange }: { stats: Stat[]; onT
 
     const fetchData = async () => {
       try {
-        const students = await apiRequest('get', '/api/student/');
-        const groups = await apiRequest('get', '/api/group/');
-        const mentors = await apiRequest('get', '/api/mentors');
+        const { students, groups } = await getDashboard();
+        const mentors = new Set(groups.map((group) => group.mentor_id));
         setStats([
           { title: 'Total Students', value: students.length.toString(), icon: 'UsersRound', color: 'text-blue-500' },
           { title: 'Active Groups', value: groups.length.toString(), icon: 'Layers', color: 'text-green-500' },
-          { title: 'Mentors', value: mentors.length.toString(), icon: 'User2', color: 'text-purple-500' },
+          { title: 'Mentors', value: mentors.size.toString(), icon: 'User2', color: 'text-purple-500' },
         ]);
       } catch (error) {
         console.error('CEO Dashboard xatosi:', error);
@@ -36,7 +36,7 @@ const CEODashboard = ({ stats: initialStats, onTabChange }: { stats: Stat[]; onT
     };
 
     fetchData();
-  }, [apiRequest, user, tokens, navigate]);
+  }, [user, tokens, navigate]);
 
   return (
     <div>
@@ -10,6 +10,8 @@ import MentorDashboard from './dashboard/MentorDashboard';
 import AdminDashboard from './dashboard/AdminDashboard';
 import StudentDashboard from './dashboard/StudentDashboard';
 import { useNavigate } from 'react-router-dom';
+import { useChangeEvents } from '@/hooks/use-change-events';
+import { getDashboard } from '@/lib/dataService';
 
 const initialStats = {
   CEO: [
@@ -36,12 +38,16 @@ const initialStats = {
 };
 
 const Dashboard = () => {
-  const { user, tokens, apiRequest, logout } = useAuth();
+  const { user, tokens } = useAuth();
   const [activeTab, setActiveTab] = useState('overview');
   const [stats, setStats] = useState(initialStats);
   const [loading, setLoading] = useState(true);
+  // Bumped by the event stream; refetches the stats without showing the spinner again
+  const [version, setVersion] = useState(0);
   const navigate = useNavigate();
 
+  useChangeEvents(['student', 'attendance', 'score'], () => setVersion((current) => current + 1));
+
   useEffect(() => {
     if (!tokens?.access || !user) {
       navigate('/login');
@@ -49,42 +55,34 @@ const Dashboard = () => {
     }
 
     const fetchDashboardData = async () => {
-      setLoading(true);
       try {
+        // One role-scoped request; the server already limits groups, students and marks to what the user sees
+        const dashboard = await getDashboard();
+        const marks = dashboard.attendance_today;
+        const present = marks.filter((mark) => mark.present).length;
+        const attendanceRate = marks.length ? Math.round((100 * present) / marks.length) : 0;
+        const mentors = new Set(dashboard.groups.map((group) => group.mentor_id));
         let updatedStats = { ...stats };
 
         switch (user.role) {
           case 'CEO':
-            const students = await apiRequest('get', '/api/student/');
-            const groups = await apiRequest('get', '/api/group/');
-            const mentors = await apiRequest('get', '/api/mentors');
-            updatedStats.CEO[0].value = students.length.toString();
-            updatedStats.CEO[1].value = groups.length.toString();
-            updatedStats.CEO[2].value = mentors.length.toString();
+            updatedStats.CEO[0].value = dashboard.students.length.toString();
+            updatedStats.CEO[1].value = dashboard.groups.length.toString();
+            updatedStats.CEO[2].value = mentors.size.toString();
             break;
 
           case 'Admin':
-            const adminGroups = await apiRequest('get', '/api/group/');
-            const attendance = await apiRequest('get', '/api/attendance/');
-            updatedStats.Admin[0].value = adminGroups.length.toString();
-            updatedStats.Admin[1].value = `${attendance.rate || 0}%`;
+            updatedStats.Admin[0].value = dashboard.groups.length.toString();
+            updatedStats.Admin[1].value = `${attendanceRate}%`;
             break;
 
           case 'Mentor':
-            const mentorGroups = await apiRequest('get', `/api/groups/mentor/${user.id}/`);
-            const mentorStudents = await apiRequest('get', `/api/students/mentor/${user.id}/`);
-            const assignments = await apiRequest('get', `/api/assignments/mentor/${user.id}/`);
-            updatedStats.Mentor[0].value = mentorGroups.length.toString();
-            updatedStats.Mentor[1].value = mentorStudents.length.toString();
-            updatedStats.Mentor[2].value = assignments.length.toString();
+            updatedStats.Mentor[0].value = dashboard.groups.length.toString();
+            updatedStats.Mentor[1].value = dashboard.students.length.toString();
             break;
 
           case 'Student':
-            const studentData = await apiRequest('get', `/api/students/${user.id}/`);
-            updatedStats.Student[0].value = `${studentData.average_score || 0}%`;
-            updatedStats.Student[1].value = `${studentData.attendance_rate || 0}%`;
-            const upcomingTests = await apiRequest('get', `/api/tests/student/${user.id}/upcoming/`);
-            updatedStats.Student[2].value = upcomingTests.length.toString();
+            // Score averages and upcoming tests are not part of the dashboard bundle
             break;
 
           default:
@@ -93,18 +91,15 @@ const Dashboard = () => {
 
         setStats(updatedStats);
       } catch (error) {
+        // fetchApi already sends an expired session back to the login page
         console.error('Dashboard ma\'lumotlarini olish xatosi:', error);
-        if (error.response?.status === 401) {
-          logout();
-          navigate('/login');
-        }
       } finally {
         setLoading(false);
       }
     };
 
     fetchDashboardData();
-  }, [user, tokens, apiRequest, navigate, logout]);
+  }, [user, tokens, navigate, version]);
 
   const renderDashboardByRole = () => {
     if (loading) {
@@ -1,6 +1,7 @@
 
 import React, { useState, useEffect } from 'react';
-// import { apiGetTopStudents } from '@/lib/api';
+import { apiGetTopStudents } from '@/lib/api';
+import { useChangeEvents } from '@/hooks/use-change-events';
 import { Student } from '@/lib/types';
 import { 
   Card, 
@@ -24,13 +25,16 @@ const TopStudents = () => {
   const [topStudents, setTopStudents] = useState<Student[]>([]);
   const [isLoading, setIsLoading] = useState(true);
   const [error, setError] = useState<string | null>(null);
+  // Coins change with scores and student edits; refetch when the event stream reports one
+  const [version, setVersion] = useState(0);
+
+  useChangeEvents(['student', 'score'], () => setVersion((current) => current + 1));
 
   useEffect(() => {
     const fetchTopStudents = async () => {
       try {
-        setIsLoading(true);
-        // const students = await apiGetTopStudents(10);
-        // setTopStudents(students);
+        const students = await apiGetTopStudents(10);
+        setTopStudents(students);
         setError(null);
       } catch (err) {
         console.error('Failed to fetch top students:', err);
@@ -41,7 +45,7 @@ const TopStudents = () => {
     };
 
     fetchTopStudents();
-  }, []);
+  }, [version]);
 
   return (
     <Card>
@@ -0,0 +1,26 @@
+import * as React from "react"
+
+import { apiSubscribeEvents, ChangeEvent } from "@/lib/api"
+
+// Calls `onChange` when the backend reports a change of one of `events`, instead of
+// polling. Changes arriving within `delay` ms of each other trigger a single call.
+// All components share the tab's one event stream, see `apiSubscribeEvents`.
+export function useChangeEvents(events: ChangeEvent[], onChange: () => void, delay = 500) {
+  const callback = React.useRef(onChange)
+  callback.current = onChange
+  const key = events.join(",")
+
+  React.useEffect(() => {
+    const wanted = new Set(key.split(","))
+    let timer: ReturnType<typeof setTimeout> | undefined
+    const close = apiSubscribeEvents((event) => {
+      if (!wanted.has(event)) return
+      clearTimeout(timer)
+      timer = setTimeout(() => callback.current(), delay)
+    })
+    return () => {
+      clearTimeout(timer)
+      close()
+    }
+  }, [key, delay])
+}
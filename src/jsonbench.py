@@ -0,0 +1,79 @@
+"""
+Serialisation microbenchmark for the list endpoints.
+
+Seeds a throwaway SQLite database and serialises the whole student and
+attendance tables the way the list routes used to (ORM objects validated into
+``response_model`` objects, then encoded with the stdlib JSON encoder) and the
+way they do now (column tuples turned into dicts and encoded by
+``FastJSONResponse``), printing rows/sec for both.
+
+Usage:
+    python jsonbench.py [--rows 20000] [--repeat 5]
+"""
+
+import argparse
+import datetime
+import time
+from typing import List
+
+import testbed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Benchmark list serialisation of the O'quv Markazi API")
+    parser.add_argument("--rows", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    return parser.parse_args()
+
+
+def model_path(backend, model, response_model):
+    # Before: ORM entities -> response_model validation -> stdlib json
+    from fastapi.responses import JSONResponse
+    from pydantic import TypeAdapter
+
+    adapter = TypeAdapter(List[response_model])
+    db = backend.SessionLocal()
+    try:
+        rows = db.query(model).order_by(model.id).all()
+        return JSONResponse(content=adapter.dump_python(adapter.validate_python(rows), mode="json")).body
+    finally:
+        db.close()
+
+
+def tuple_path(backend, model):
+    # After: column tuples -> dicts -> FastJSONResponse
+    db = backend.SessionLocal()
+    try:
+        rows, _, _ = backend.fetch_page(db, db.query(model), model, None, None)
+        return backend.FastJSONResponse(content=rows).body
+    finally:
+        db.close()
+
+
+def measure(fn, rows: int, repeat: int) -> float:
+    fn()  # warm up
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - started)
+    return rows / best
+
+
+def main():
+    args = parse_args()
+    backend = testbed.load_backend("jsonbench")
+    # One group of ``rows`` students with one mark each
+    testbed.seed_centre(backend, 1, args.rows, days=[datetime.date(2024, 1, 1)])
+    print(f"encoder: {'orjson' if backend.orjson is not None else 'stdlib json'}")
+    for name, model, response_model in [
+        ("students", backend.StudentDB, backend.Student),
+        ("attendance", backend.AttendanceDB, backend.Attendance),
+    ]:
+        before = measure(lambda: model_path(backend, model, response_model), args.rows, args.repeat)
+        after = measure(lambda: tuple_path(backend, model), args.rows, args.repeat)
+        print(f"{name:<10} response_model {before:10.0f} rows/s   column tuples {after:10.0f} rows/s   {after / before:5.1f}x")
+
+
+if __name__ == "__main__":
+    main()
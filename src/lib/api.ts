@@ -27,13 +27,18 @@ const safeLocalStorage = {
   }
 };
 
+// AuthContext keeps its session under "accessToken", apiLogin under "eduAccessToken"
+const getAccessToken = (): string | null => {
+  return safeLocalStorage.getItem("eduAccessToken") || safeLocalStorage.getItem("accessToken");
+};
+
 // Helper function for API requests
 const fetchApi = async (endpoint: string, options: RequestInit = {}) => {
   // Get API base URL
   const API_BASE_URL = getApiBaseUrl();
   
   // Get token from localStorage if available
-  const token = safeLocalStorage.getItem("eduAccessToken");
+  const token = getAccessToken();
   
   // Default headers
   const headers = {
@@ -110,6 +115,26 @@ const refreshAccessToken = async (): Promise<boolean> => {
   }
 };
 
+// Optional keyset pagination / field selection supported by the list endpoints
+export interface ListParams {
+  limit?: number;
+  after?: number;
+  fields?: string[];
+}
+
+const appendListParams = (params: URLSearchParams, listParams?: ListParams) => {
+  if (!listParams) return params;
+  if (listParams.limit) params.append("limit", String(listParams.limit));
+  if (listParams.after) params.append("after", String(listParams.after));
+  if (listParams.fields?.length) params.append("fields", listParams.fields.join(","));
+  return params;
+};
+
+const withListParams = (endpoint: string, listParams?: ListParams) => {
+  const queryString = appendListParams(new URLSearchParams(), listParams).toString();
+  return queryString ? `${endpoint}?${queryString}` : endpoint;
+};
+
 // Auth endpoints
 export const apiLogin = async (data: LoginFormData) => {
   const API_BASE_URL = getApiBaseUrl();
@@ -162,9 +187,38 @@ export const apiGetCurrentUser = async (): Promise<User | null> => {
   }
 };
 
+// Dashboard bootstrap - the signed-in user's role-scoped first-paint data in one request
+export interface GroupSummary {
+  id: number;
+  name: string;
+  mentor_id: number;
+  schedule: string;
+  price: number | null;
+}
+
+export interface StudentSummary {
+  id: number;
+  name: string;
+  group_id: number | null;
+  coins: number;
+}
+
+export interface DashboardBundle {
+  user: User;
+  groups: GroupSummary[];
+  students: StudentSummary[];
+  // Ranked within the groups the user sees
+  top_students: StudentSummary[];
+  attendance_today: Attendance[];
+}
+
+export const apiGetDashboard = async (top = 10): Promise<DashboardBundle> => {
+  return await fetchApi(`/dashboard/?top=${top}`);
+};
+
 // Groups endpoints
-export const apiGetGroups = async (): Promise<Group[]> => {
-  return await fetchApi("/group/");
+export const apiGetGroups = async (listParams?: ListParams): Promise<Group[]> => {
+  return await fetchApi(withListParams("/group/", listParams));
 };
 
 export const apiGetGroupById = async (id: string): Promise<Group> => {
@@ -190,14 +244,20 @@ export const apiDeleteGroup = async (id: string): Promise<void> => {
 };
 
 // Students endpoints
-export const apiGetStudents = async (): Promise<Student[]> => {
-  return await fetchApi("/student/");
+export const apiGetStudents = async (listParams?: ListParams): Promise<Student[]> => {
+  return await fetchApi(withListParams("/student/", listParams));
 };
 
 export const apiGetStudentById = async (id: string): Promise<Student> => {
   return await fetchApi(`/student/${id}/`);
 };
 
+// Ranked search over name, phones and username; matches word prefixes, best first
+export const apiSearchStudents = async (query: string, limit = 20, offset = 0): Promise<Student[]> => {
+  const params = new URLSearchParams({ q: query, limit: String(limit), offset: String(offset) });
+  return await fetchApi(`/student/search/?${params.toString()}`);
+};
+
 export const apiCreateStudent = async (data: Partial<Student>): Promise<Student> => {
   return await fetchApi("/student/", {
     method: "POST",
@@ -216,13 +276,52 @@ export const apiDeleteStudent = async (id: string): Promise<void> => {
   await fetchApi(`/student/${id}/`, { method: "DELETE" });
 };
 
+export interface StudentImportResult {
+  created: number;
+  dry_run: boolean;
+  errors: { row: number; detail: string }[];
+}
+
+// Upload a .csv/.xlsx roster; with dryRun nothing is written, only the row errors are reported
+export const apiImportStudents = async (file: File, dryRun = false): Promise<StudentImportResult> => {
+  const body = new FormData();
+  body.append("file", file);
+  const token = getAccessToken();
+  const response = await fetch(`${getApiBaseUrl()}/student/import/?dry_run=${dryRun}`, {
+    method: "POST",
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+    body,
+  });
+  if (!response.ok) {
+    const errorData = await response.json().catch(() => ({}));
+    throw new Error(errorData.detail || `API Error: ${response.status}`);
+  }
+  return await response.json();
+};
+
 // Attendance endpoints
-export const apiGetAttendance = async (studentId?: string, groupId?: string): Promise<Attendance[]> => {
+// Archived terms are only read when `dateFrom` reaches into them, or every one with `includeArchived`
+export interface DateRange {
+  dateFrom?: string;
+  dateTo?: string;
+  includeArchived?: boolean;
+}
+
+const appendDateRange = (params: URLSearchParams, range?: DateRange) => {
+  if (range?.dateFrom) params.append("date_from", range.dateFrom);
+  if (range?.dateTo) params.append("date_to", range.dateTo);
+  if (range?.includeArchived) params.append("include_archived", "true");
+  return params;
+};
+
+export const apiGetAttendance = async (studentId?: string, groupId?: string, listParams?: ListParams, range?: DateRange): Promise<Attendance[]> => {
   let endpoint = "/attendance/";
   const params = new URLSearchParams();
   
   if (studentId) params.append("student_id", studentId);
   if (groupId) params.append("group_id", groupId);
+  appendDateRange(params, range);
+  appendListParams(params, listParams);
   
   const queryString = params.toString();
   if (queryString) endpoint += `?${queryString}`;
@@ -241,6 +340,18 @@ export const apiRecordAttendance = async (data: {
   });
 };
 
+// Whole-group roll call in one request; rows that fail are reported in `errors`
+export const apiRecordAttendanceBulk = async (data: {
+  group_id: string;
+  date: string;
+  records: { student_id: string; present: boolean }[];
+}): Promise<{ recorded: number; errors: { student_id: number; detail: string }[] }> => {
+  return await fetchApi("/attendance/bulk/", {
+    method: "POST",
+    body: JSON.stringify(data),
+  });
+};
+
 export const apiUpdateAttendance = async (id: string, data: Partial<Attendance>): Promise<Attendance> => {
   return await fetchApi(`/attendance/${id}/`, {
     method: "PUT",
@@ -249,9 +360,16 @@ export const apiUpdateAttendance = async (id: string, data: Partial<Attendance>)
 };
 
 // Scores and Coins endpoints
-export const apiGetScores = async (studentId?: string): Promise<Score[]> => {
+export const apiGetScores = async (studentId?: string, listParams?: ListParams, range?: DateRange): Promise<Score[]> => {
   let endpoint = "/scores/";
-  if (studentId) endpoint += `?student_id=${studentId}`;
+  const params = new URLSearchParams();
+  
+  if (studentId) params.append("student_id", studentId);
+  appendDateRange(params, range);
+  appendListParams(params, listParams);
+  
+  const queryString = params.toString();
+  if (queryString) endpoint += `?${queryString}`;
   
   return await fetchApi(endpoint);
 };
@@ -269,17 +387,127 @@ export const apiAddScore = async (data: {
   });
 };
 
-// Top students
-const headers = {
-  'Authorization': `Bearer ${localStorage.getItem('access_token')}`,
-  'Content-Type': 'application/json'
+// Award scores and coins to many students in one request
+export const apiAddScoresBulk = async (data: {
+  date: string;
+  records: { student_id: string; value: number; description?: string; coins?: number }[];
+}): Promise<{ recorded: number; errors: { student_id: number; detail: string }[] }> => {
+  return await fetchApi("/scores/bulk/", {
+    method: "POST",
+    body: JSON.stringify(data),
+  });
+};
+
+// Analytics endpoints - summaries computed by the backend instead of in the browser
+export type AnalyticsBy = "student" | "group" | "mentor" | "month";
+
+export interface AnalyticsFilters {
+  studentId?: string;
+  groupId?: string;
+  dateFrom?: string;
+  dateTo?: string;
+}
+
+const analyticsEndpoint = (path: string, by: AnalyticsBy, filters: AnalyticsFilters = {}) => {
+  const params = new URLSearchParams({ by });
+  if (filters.studentId) params.append("student_id", filters.studentId);
+  if (filters.groupId) params.append("group_id", filters.groupId);
+  if (filters.dateFrom) params.append("date_from", filters.dateFrom);
+  if (filters.dateTo) params.append("date_to", filters.dateTo);
+  return `${path}?${params.toString()}`;
+};
+
+export const apiGetAttendanceStats = async (by: AnalyticsBy, filters?: AnalyticsFilters): Promise<{ key: number | string | null; total: number; present: number; rate: number }[]> => {
+  return await fetchApi(analyticsEndpoint("/analytics/attendance/", by, filters));
+};
+
+export const apiGetScoreStats = async (by: AnalyticsBy, filters?: AnalyticsFilters): Promise<{ key: number | string | null; count: number; sum: number; average: number }[]> => {
+  return await fetchApi(analyticsEndpoint("/analytics/scores/", by, filters));
 };
 
-// So'rovni yuborish
-fetch('/api/student/top/?limit=10', {
-  method: 'GET',
-  headers: headers
-})
+export const apiGetCoinStats = async (by: Exclude<AnalyticsBy, "month"> = "group"): Promise<{ key: number | null; students: number; coins: number }[]> => {
+  return await fetchApi(`/analytics/coins/?by=${by}`);
+};
+
+// Change notifications - replaces polling; returns a function that ends the subscription.
+// Every subscriber in the tab shares one stream, opened with the first and closed with the last.
+export type ChangeEvent = "student" | "attendance" | "score";
+type ChangeListener = (event: ChangeEvent, records: Record<string, unknown>[]) => void;
+
+const CHANGE_EVENTS: ChangeEvent[] = ["student", "attendance", "score"];
+const STREAM_REOPEN_DELAY = 5000;
+const changeListeners = new Set<ChangeListener>();
+let changeStream: EventSource | null = null;
+let reopenTimer: ReturnType<typeof setTimeout> | undefined;
+
+const openChangeStream = (reopened = false) => {
+  const token = getAccessToken();
+  const source = new EventSource(`${getApiBaseUrl()}/events/?token=${encodeURIComponent(token || "")}`);
+  const notify = (event: ChangeEvent, records: Record<string, unknown>[]) => {
+    changeListeners.forEach((listener) => listener(event, records));
+  };
+  CHANGE_EVENTS.forEach((event) => {
+    source.addEventListener(event, (message) => notify(event, JSON.parse((message as MessageEvent).data)));
+  });
+  source.onopen = () => {
+    // Changes made while the stream was down were missed, so everyone reloads once
+    if (reopened) CHANGE_EVENTS.forEach((event) => notify(event, []));
+    reopened = false;
+  };
+  source.onerror = () => {
+    // The browser retries dropped connections itself, but gives up for good on an HTTP
+    // error such as the 401 once the token in the URL expires: reopen with a current one
+    if (source.readyState !== EventSource.CLOSED || changeStream !== source) return;
+    changeStream = null;
+    reopenTimer = setTimeout(async () => {
+      reopenTimer = undefined;
+      await refreshAccessToken();
+      if (changeListeners.size && !changeStream) openChangeStream(true);
+    }, STREAM_REOPEN_DELAY);
+  };
+  changeStream = source;
+};
+
+export const apiSubscribeEvents = (onEvent: ChangeListener): (() => void) => {
+  changeListeners.add(onEvent);
+  if (!changeStream && reopenTimer === undefined) openChangeStream();
+  return () => {
+    changeListeners.delete(onEvent);
+    if (changeListeners.size) return;
+    clearTimeout(reopenTimer);
+    reopenTimer = undefined;
+    changeStream?.close();
+    changeStream = null;
+  };
+};
+
+// Export endpoints - streamed CSV/NDJSON files, returned as a Blob for download
+export const apiExport = async (
+  table: "attendance" | "scores" | "students",
+  format: "csv" | "ndjson" = "csv",
+  filters: Omit<AnalyticsFilters, "studentId"> = {}
+): Promise<Blob> => {
+  const params = new URLSearchParams({ format });
+  if (filters.groupId) params.append("group_id", filters.groupId);
+  if (filters.dateFrom) params.append("date_from", filters.dateFrom);
+  if (filters.dateTo) params.append("date_to", filters.dateTo);
+  
+  const token = getAccessToken();
+  const response = await fetch(`${getApiBaseUrl()}/export/${table}/?${params.toString()}`, {
+    headers: token ? { Authorization: `Bearer ${token}` } : {},
+  });
+  if (!response.ok) {
+    throw new Error(`API Error: ${response.status}`);
+  }
+  return await response.blob();
+};
+
+// Top students - served from the backend's in-memory leaderboard
+export const apiGetTopStudents = async (limit = 10, groupId?: string): Promise<Student[]> => {
+  const params = new URLSearchParams({ limit: String(limit) });
+  if (groupId) params.append("group_id", groupId);
+  return await fetchApi(`/student/top/?${params.toString()}`);
+};
 
 // Mentor endpoints
 export const apiGetMentors = async (): Promise<User[]> => {
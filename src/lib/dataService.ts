@@ -16,7 +16,9 @@ import {
   apiGetMentors,
   apiGetTopStudents,
   apiGetAttendance,
-  apiGetScores
+  apiGetScores,
+  apiGetDashboard,
+  DashboardBundle
 } from "./api";
 
 // Service layer that wraps API calls but maintains compatibility with existing codebase
@@ -58,8 +60,10 @@ export const getStudentById = async (studentId: string): Promise<Student | null>
 
 export const getStudentByUserId = async (userId: string): Promise<Student | null> => {
   try {
-    const allStudents = await apiGetStudents();
-    return allStudents.find(student => student.userId === userId) || null;
+    // Only the ids are needed to find the match; the full record is fetched afterwards
+    const allStudents = await apiGetStudents({ fields: ["user_id"] }) as unknown as { id: number; user_id: number | null }[];
+    const match = allStudents.find(student => String(student.user_id) === userId);
+    return match ? await apiGetStudentById(String(match.id)) : null;
   } catch (error) {
     console.error("Failed to get student by user ID:", error);
     return null;
@@ -94,6 +98,15 @@ export const getTopStudents = async (limit = 10): Promise<Student[]> => {
   }
 };
 
+// Dashboard - one request for the first paint instead of one per panel
+export const getDashboard = async (top = 10): Promise<DashboardBundle> => {
+  const dashboard = await apiGetDashboard(top);
+  return {
+    ...dashboard,
+    top_students: dashboard.top_students.map((student, index) => ({ ...student, rank: index + 1 }))
+  };
+};
+
 // Compatibility functions to ensure the app works while transitioning to API
 // These can be removed once all components are updated to use the API directly
 
@@ -0,0 +1,123 @@
+"""
+Concurrent-request load test for the FastAPI backend.
+
+Seeds a throwaway SQLite database, then fires concurrent requests at the app
+through an in-process ASGI client and prints the throughput per endpoint,
+followed by the time to record a whole group's roll call row by row versus
+through the bulk endpoint.
+
+Each of ``--modes`` runs against its own fresh database: ``inline`` is the
+original request path, with every handler's database work run directly on the
+event loop, and ``sync``/``async`` are the ``DB_MODE`` paths that move it off.
+The last table is each mode's throughput against the first one.
+
+Usage:
+    python loadtest.py [--modes inline,sync,async] [--requests 200] [--concurrency 20]
+"""
+
+import argparse
+import asyncio
+import datetime
+import time
+
+import testbed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Load test the O'quv Markazi API")
+    parser.add_argument("--modes", default="inline,sync,async", help="comma-separated: inline, sync, async")
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--students", type=int, default=500)
+    parser.add_argument("--days", type=int, default=60)
+    return parser.parse_args()
+
+
+def run_inline(backend):
+    # The request path before DB_MODE: units of work run inline, blocking the event loop
+    async def run_db(db, fn, *args, **kwargs):
+        return backend.run_unit(db, fn, *args, **kwargs)
+
+    backend.run_db = run_db
+
+
+async def run(backend, mode: str, args) -> dict:
+    import httpx
+
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://loadtest") as client:
+        response = await client.post("/api/auth/login/", json={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access']}"}
+
+        throughput = {}
+        for path in ["/api/group/", "/api/student/", "/api/attendance/?group_id=1"]:
+            semaphore = asyncio.Semaphore(args.concurrency)
+
+            async def request():
+                async with semaphore:
+                    r = await client.get(path, headers=headers)
+                    r.raise_for_status()
+
+            started = time.perf_counter()
+            await asyncio.gather(*(request() for _ in range(args.requests)))
+            elapsed = time.perf_counter() - started
+            throughput[path] = args.requests / elapsed
+            print(f"{mode:>6} {path:<28} {throughput[path]:8.1f} req/s")
+
+        await roll_call(client, headers, mode, args)
+    return throughput
+
+
+async def roll_call(client, headers, mode: str, args):
+    # Mark group 1 present on fresh days, once per student and once in bulk
+    response = await client.get("/api/student/?fields=group_id", headers=headers)
+    student_ids = [row["id"] for row in response.json() if row["group_id"] == 1]
+    first_day = datetime.date(2024, 1, 1) + datetime.timedelta(days=args.days)
+
+    started = time.perf_counter()
+    for student_id in student_ids:
+        r = await client.post(
+            "/api/attendance/",
+            json={"date": first_day.isoformat(), "present": True, "student_id": student_id},
+            headers=headers,
+        )
+        r.raise_for_status()
+    per_row = time.perf_counter() - started
+
+    started = time.perf_counter()
+    r = await client.post(
+        "/api/attendance/bulk/",
+        json={
+            "group_id": 1,
+            "date": (first_day + datetime.timedelta(days=1)).isoformat(),
+            "records": [{"student_id": student_id, "present": True} for student_id in student_ids],
+        },
+        headers=headers,
+    )
+    r.raise_for_status()
+    bulk = time.perf_counter() - started
+    print(f"{mode:>6} roll call of {len(student_ids)} students: {per_row * 1000:8.1f} ms per-row, {bulk * 1000:8.1f} ms bulk")
+
+
+def main():
+    args = parse_args()
+    modes = args.modes.split(",")
+    days = [datetime.date(2024, 1, 1) + datetime.timedelta(days=day) for day in range(args.days)]
+    results = {}
+    for mode in modes:
+        backend = testbed.load_backend(f"loadtest-{mode}", "sync" if mode == "inline" else mode)
+        if mode == "inline":
+            run_inline(backend)
+        testbed.seed_centre(backend, max(1, args.students // 25), min(args.students, 25), days=days)
+        results[mode] = asyncio.run(run(backend, mode, args))
+
+    baseline = modes[0]
+    if len(modes) > 1:
+        print(f"\nChange against {baseline} (throughput):")
+    for mode in modes[1:]:
+        for path, throughput in results[mode].items():
+            print(f"{mode:>6} {path:<28} {(throughput / results[baseline][path] - 1) * 100:+7.1f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Query-count regression check for the FastAPI backend.
+
+Calls every read endpoint against a small and a large seeded database and
+fails if the number of SQL statements an endpoint issues grows with the
+number of rows (the classic N+1 pattern).
+
+Usage:
+    python querycount.py [--small 5] [--large 50]
+"""
+
+import argparse
+import datetime
+import os
+import sys
+
+import testbed
+
+ENDPOINTS = [
+    "/api/auth/user/",
+    "/api/group/",
+    "/api/group/1/",
+    "/api/student/",
+    "/api/student/1/",
+    "/api/attendance/",
+    "/api/attendance/?group_id=1",
+    "/api/scores/",
+    "/api/student/top/",
+    "/api/dashboard/",
+]
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Check that endpoint query counts do not grow with row counts")
+    parser.add_argument("--small", type=int, default=5, help="groups in the small dataset")
+    parser.add_argument("--large", type=int, default=50, help="groups in the large dataset")
+    return parser.parse_args()
+
+
+class QueryCounter:
+    def __init__(self, engine):
+        from sqlalchemy import event
+
+        self.count = 0
+        event.listen(engine, "before_cursor_execute", self.before_cursor_execute)
+
+    def before_cursor_execute(self, conn, cursor, statement, parameters, context, executemany):
+        self.count += 1
+
+
+def add_rows(backend, groups: int):
+    # Grow the dataset to ``groups`` groups of 5 students with attendance and scores
+    with backend.engine.connect() as connection:
+        existing = connection.execute(backend.select(backend.func.count()).select_from(backend.GroupDB)).scalar()
+    day = datetime.date(2024, 2, 1)
+    testbed.seed_centre(backend, groups - existing, 5, days=[day], score_days=[day])
+
+
+def measure(client, counter, headers) -> dict:
+    counts = {}
+    for path in ENDPOINTS:
+        client.get(path, headers=headers)  # warm the user cache
+        counter.count = 0
+        response = client.get(path, headers=headers)
+        response.raise_for_status()
+        counts[path] = counter.count
+    return counts
+
+
+def main():
+    args = parse_args()
+    backend = testbed.load_backend("querycount", os.environ.get("DB_MODE", "sync"))
+    from fastapi.testclient import TestClient
+
+    counter = QueryCounter(backend.async_engine.sync_engine if backend.async_engine is not None else backend.engine)
+    client = TestClient(backend.app)
+    headers = testbed.auth_headers(client)
+
+    add_rows(backend, args.small)
+    small = measure(client, counter, headers)
+    add_rows(backend, args.large)
+    large = measure(client, counter, headers)
+
+    failures = 0
+    for path in ENDPOINTS:
+        ok = small[path] == large[path]
+        failures += not ok
+        print(f"{'ok' if ok else 'FAIL':>4} {path:<30} {small[path]:>3} -> {large[path]:>3} queries")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""
+Concurrency stress test for the SQLite write path.
+
+Starts several worker processes, each running the app in-process the way
+separate uvicorn workers would, and has them record attendance and award
+coins against the same database file while also reading. Reports failed
+requests (e.g. "database is locked") and checks that no coin award was lost.
+
+Usage:
+    python stresstest.py [--workers 4] [--rounds 20] [--profile production]
+"""
+
+import argparse
+import asyncio
+import datetime
+import multiprocessing
+import sys
+
+import testbed
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Stress concurrent SQLite writers")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--concurrency", type=int, default=10, help="requests in flight per worker")
+    parser.add_argument("--students", type=int, default=50)
+    parser.add_argument("--profile", default="production", help="SQLITE_PROFILE to test")
+    return parser.parse_args()
+
+
+async def hammer(worker: int, args, first: int) -> int:
+    import httpx
+
+    # Workers bootstrap concurrently, like uvicorn workers starting together
+    backend = testbed.import_backend()
+    failures = 0
+    transport = httpx.ASGITransport(app=backend.app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://stresstest") as client:
+        response = await client.post("/api/auth/login/", json={"username": "admin", "password": "admin123"})
+        headers = {"Authorization": f"Bearer {response.json()['access']}"}
+
+        for round_number in range(args.rounds):
+            day = datetime.date(2024, 1, 1) + datetime.timedelta(days=worker * args.rounds + round_number)
+            requests = []
+            for i in range(args.concurrency):
+                student_id = first + (worker * args.concurrency + i) % args.students
+                requests.append(client.post(
+                    "/api/attendance/",
+                    json={"date": day.isoformat(), "present": True, "student_id": student_id},
+                    headers=headers,
+                ))
+                requests.append(client.post(
+                    "/api/scores/?coins=1",
+                    json={"date": day.isoformat(), "value": 5, "student_id": student_id},
+                    headers=headers,
+                ))
+                requests.append(client.get("/api/attendance/?limit=50", headers=headers))
+            for result in await asyncio.gather(*requests, return_exceptions=True):
+                if isinstance(result, Exception) or result.status_code >= 400:
+                    failures += 1
+                    print(f"worker {worker}: {result if isinstance(result, Exception) else result.text}")
+    return failures
+
+
+def worker_main(worker: int, args, first: int, results):
+    results.put(asyncio.run(hammer(worker, args, first)))
+
+
+def stress(backend, args):
+    """Seed ``args.students`` students, run the workers against the database; returns (failures, awarded, expected)."""
+    centre = testbed.seed_centre(backend, 1, args.students, coins=0)
+    first = centre["student_ids"][0]
+
+    context = multiprocessing.get_context("spawn")
+    results = context.Queue()
+    processes = [context.Process(target=worker_main, args=(i, args, first, results)) for i in range(args.workers)]
+    for process in processes:
+        process.start()
+    failures = sum(results.get() for _ in processes)
+    for process in processes:
+        process.join()
+
+    with backend.engine.connect() as connection:
+        awarded = connection.execute(backend.select(backend.func.sum(backend.StudentDB.coins)).where(
+            backend.StudentDB.id.in_(centre["student_ids"])
+        )).scalar()
+    return failures, awarded, args.workers * args.rounds * args.concurrency
+
+
+def main():
+    args = parse_args()
+    # Create and seed the database once, before any worker starts
+    backend = testbed.load_backend("stresstest", SQLITE_PROFILE=args.profile)
+    failures, awarded, expected = stress(backend, args)
+    print(f"profile={args.profile} failed requests={failures} coins awarded={awarded}/{expected}")
+    sys.exit(1 if failures or awarded != expected else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""
+Shared setup for the benchmark and check scripts and the test suite.
+
+``load_backend`` points the app at a throwaway SQLite database (and term
+archive directory), imports it and runs its startup; ``seed_centre`` adds
+groups of students with attendance and scores through Core executemany.
+"""
+
+import datetime
+import importlib
+import os
+import random
+import sys
+import tempfile
+from typing import Iterable, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+BACKEND = "FastAPI_Backend_Template"
+
+
+def import_backend():
+    """Import the app as configured by the environment and make it ready to serve.
+
+    Imported again if an earlier ``load_backend`` already did, so each caller
+    gets the database its environment names.
+    """
+    if HERE not in sys.path:
+        sys.path.insert(0, HERE)
+    if BACKEND in sys.modules:
+        backend = importlib.reload(sys.modules[BACKEND])
+    else:
+        backend = importlib.import_module(BACKEND)
+    backend.startup()
+    return backend
+
+
+def load_backend(prefix: str, mode: Optional[str] = None, **env):
+    """``import_backend`` against a fresh database in a new temporary directory.
+
+    ``env`` sets further configuration variables (``SQLITE_PROFILE`` and so on) first.
+    """
+    workdir = tempfile.mkdtemp(prefix=f"{prefix}-")
+    os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(workdir, prefix + '.db')}"
+    os.environ["ARCHIVE_DIR"] = os.path.join(workdir, "archive")
+    if mode:
+        os.environ["DB_MODE"] = mode
+    os.environ.update(env)
+    return import_backend()
+
+
+def seed_centre(backend, groups: int, students_per_group: int, days: Iterable[datetime.date] = (),
+                score_days: Iterable[datetime.date] = (), coins: Optional[int] = None,
+                rng: Optional[random.Random] = None) -> dict:
+    """Add ``groups`` groups of students mentored by ``mentor1``, then rebuild the rollups and leaderboard.
+
+    Every student gets a mark on each of ``days`` and a score on each of
+    ``score_days``; ``coins`` fixes their starting coins (random otherwise).
+    Returns the new group and student ids and the number of rows inserted.
+    """
+    from sqlalchemy import insert, select
+
+    rng = rng or random.Random(1)
+    students = backend.StudentDB.__table__
+    with backend.engine.begin() as connection:
+        mentor_id = connection.execute(select(backend.UserDB.id).where(backend.UserDB.username == "mentor1")).scalar_one()
+        first = connection.execute(select(backend.func.count()).select_from(backend.GroupDB)).scalar()
+        group_ids = [
+            connection.execute(insert(backend.GroupDB.__table__).values(
+                name=f"Group {first + g}", mentor_id=mentor_id, schedule="Mon/Wed/Fri", price=500000
+            )).inserted_primary_key[0]
+            for g in range(groups)
+        ]
+        student_ids = []
+        for g, group_id in enumerate(group_ids):
+            student_ids += connection.execute(insert(students).returning(students.c.id, sort_by_parameter_order=True), [
+                {"name": f"Student {first + g}-{i}", "group_id": group_id, "phone": "+998901234567",
+                 "age": rng.randint(12, 18), "coins": rng.randint(0, 200) if coins is None else coins}
+                for i in range(students_per_group)
+            ]).scalars().all()
+
+        attendance = 0
+        for day in days:
+            connection.execute(insert(backend.AttendanceDB.__table__), [
+                {"date": day, "present": rng.random() < 0.9, "student_id": student_id} for student_id in student_ids
+            ])
+            attendance += len(student_ids)
+        scores = 0
+        for day in score_days:
+            connection.execute(insert(backend.ScoreDB.__table__), [
+                {"date": day, "value": rng.randint(1, 10), "student_id": student_id, "description": "Weekly test"}
+                for student_id in student_ids
+            ])
+            scores += len(student_ids)
+        if attendance or scores:
+            backend.rebuild_rollups(connection)
+    backend.init_leaderboard()
+    return {"group_ids": group_ids, "student_ids": student_ids, "attendance": attendance, "scores": scores}
+
+
+def auth_headers(client, username: str = "admin", password: str = "admin123") -> dict:
+    # Works with TestClient; async clients use ``await client.post`` the same way
+    response = client.post("/api/auth/login/", json={"username": username, "password": password})
+    response.raise_for_status()
+    return {"Authorization": f"Bearer {response.json()['access']}"}
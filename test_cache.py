@@ -0,0 +1,23 @@
+"""ETag / Last-Modified revalidation of the read routes."""
+
+
+def test_unchanged_list_is_not_modified(client, admin, centre):
+    response = client.get("/api/student/", headers=admin)
+    assert response.status_code == 200
+    revalidated = client.get("/api/student/", headers={**admin, "If-None-Match": response.headers["etag"]})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+
+def test_write_changes_the_etag(client, admin, centre):
+    etag = client.get("/api/scores/", headers=admin).headers["etag"]
+    client.post("/api/scores/", json={"date": "2024-05-01", "value": 7, "student_id": centre["student_ids"][0]},
+                headers=admin).raise_for_status()
+    response = client.get("/api/scores/", headers={**admin, "If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["etag"] != etag
+
+
+def test_etag_differs_per_user(client, admin, mentor):
+    # Mentors see a subset, so one user's cached copy must not validate another's
+    assert client.get("/api/student/", headers=admin).headers["etag"] != client.get("/api/student/", headers=mentor).headers["etag"]
@@ -0,0 +1,72 @@
+"""Change events reach only the subscribers allowed to see the changed records."""
+
+import testbed
+
+
+def subscribe(backend, username: str):
+    db = backend.SessionLocal()
+    try:
+        return backend.event_broker.subscribe(backend.load_current_user(db, username))
+    finally:
+        db.close()
+
+
+def drain(subscription) -> list:
+    events = []
+    while not subscription.queue.empty():
+        events.append(subscription.queue.get_nowait())
+    return events
+
+
+def other_mentors_student(backend) -> int:
+    # A student in a group taught by a second mentor
+    db = backend.SessionLocal()
+    try:
+        mentor = backend.UserDB(username="mentor2", hashed_password=backend.get_password_hash("mentor123"),
+                                name="Mentor 2", role=backend.UserRole.Mentor)
+        db.add(mentor)
+        db.flush()
+        group = backend.GroupDB(name="Other", mentor_id=mentor.id, schedule="Tue/Thu")
+        db.add(group)
+        db.flush()
+        student = backend.StudentDB(name="Other student", group_id=group.id, coins=0)
+        db.add(student)
+        db.commit()
+        return student.id
+    finally:
+        db.close()
+
+
+def test_mentor_only_sees_own_groups(backend, client, admin, centre):
+    own = centre["student_ids"][0]
+    other = other_mentors_student(backend)
+    mentor_events = subscribe(backend, "mentor1")
+    admin_events = subscribe(backend, "admin")
+    try:
+        for student_id in (own, other):
+            client.post("/api/attendance/", json={"date": "2024-05-02", "present": True, "student_id": student_id},
+                        headers=admin).raise_for_status()
+        mentor_seen = [(event, record["student_id"]) for _, event, records in drain(mentor_events) for record in records]
+        admin_seen = [(event, record["student_id"]) for _, event, records in drain(admin_events) for record in records]
+    finally:
+        backend.event_broker.unsubscribe(mentor_events)
+        backend.event_broker.unsubscribe(admin_events)
+    assert mentor_seen == [("attendance", own)]
+    assert admin_seen == [("attendance", own), ("attendance", other)]
+
+
+def test_new_group_reaches_its_mentors_open_stream(backend, client, admin):
+    mentor_events = subscribe(backend, "mentor1")
+    try:
+        group = client.post("/api/group/", json={"name": "New", "mentor_id": mentor_events.user_id, "schedule": "Sat"},
+                            headers=admin).json()
+        student = client.post("/api/student/", json={"name": "Newcomer", "group_id": group["id"]}, headers=admin).json()
+        seen = [record["id"] for _, event, records in drain(mentor_events) if event == "student" for record in records]
+    finally:
+        backend.event_broker.unsubscribe(mentor_events)
+    assert seen == [student["id"]]
+
+
+def test_students_cannot_subscribe(client, admin, centre):
+    client.post("/api/student/", json={"name": "Pupil", "username": "pupil", "password": "pupil123"}, headers=admin).raise_for_status()
+    assert client.get("/api/events/", headers=testbed.auth_headers(client, "pupil", "pupil123")).status_code == 403
@@ -0,0 +1,74 @@
+"""Roster import: every rejected row is reported, dry runs write nothing."""
+
+import io
+
+from fastapi import HTTPException
+
+# Several batches per roster, so one can fail while the others are created
+BACKEND_ENV = {"IMPORT_BATCH_SIZE": "2"}
+
+
+def upload(client, headers, text: str, **params):
+    files = {"file": ("roster.csv", io.BytesIO(text.encode()), "text/csv")}
+    return client.post("/api/student/import/", files=files, params=params, headers=headers)
+
+
+def roster(group_id: int) -> str:
+    return (
+        "name,phone,group_id,coins,username,password\n"
+        f"Ali,+998901111111,{group_id},5,ali,secret1\n"
+        f"Vali,,{group_id},,,\n"
+        f",+998902222222,{group_id},,,\n"  # row 4: no name
+        f"Soli,,{group_id},,ali,secret2\n"  # row 5: username repeated in the file
+        "Gani,,99999,,,\n"                # row 6: unknown group
+        f"Hasan,,{group_id},,hasan,\n"    # row 7: username without password
+    )
+
+
+def test_dry_run_reports_rows_and_writes_nothing(client, admin, centre):
+    group_id = centre["group_ids"][0]
+    before = client.get("/api/student/", params={"group_id": group_id}, headers=admin).json()
+    result = upload(client, admin, roster(group_id), dry_run="true").json()
+    assert result["dry_run"] is True
+    assert result["created"] == 2
+    assert [error["row"] for error in result["errors"]] == [4, 5, 6, 7]
+    assert client.get("/api/student/", params={"group_id": group_id}, headers=admin).json() == before
+
+
+def test_import_creates_valid_rows(client, admin, centre):
+    group_id = centre["group_ids"][1]
+    result = upload(client, admin, roster(group_id)).json()
+    assert result["created"] == 2
+    assert [error["row"] for error in result["errors"]] == [4, 5, 6, 7]
+    names = {row["name"] for row in client.get("/api/student/", params={"group_id": group_id}, headers=admin).json()}
+    assert {"Ali", "Vali"} <= names
+    assert client.post("/api/auth/login/", json={"username": "ali", "password": "secret1"}).status_code == 200
+
+
+def test_undecodable_csv_is_rejected(client, admin):
+    files = {"file": ("roster.csv", io.BytesIO("name\nOʻtkir\n".encode("utf-16")), "text/csv")}
+    response = client.post("/api/student/import/", files=files, headers=admin)
+    assert response.status_code == 400
+    assert "Row" in response.json()["detail"]
+
+
+def test_busy_hasher_fails_only_its_batch(backend, client, admin, centre, monkeypatch):
+    group_id = centre["group_ids"][0]
+    hash_password = backend.password_hasher.hash
+
+    async def hash_or_busy(password):
+        if password == "busy":
+            raise HTTPException(status_code=503, detail="Server is busy, please try again")
+        return await hash_password(password)
+
+    monkeypatch.setattr(backend.password_hasher, "hash", hash_or_busy)
+    text = "name,group_id,username,password\n" + "".join(
+        f"Student {n},{group_id},user{n},{'busy' if n == 3 else 'secret'}\n" for n in range(5)
+    )
+    result = upload(client, admin, text).json()
+    # Rows 2-3 and 6 are created; rows 4-5 shared a batch with the busy hash
+    assert result["created"] == 3
+    assert [(error["row"], error["detail"]) for error in result["errors"]] == [
+        (4, "Batch not imported: server busy, try again"),
+        (5, "Batch not imported: server busy, try again"),
+    ]
@@ -0,0 +1,81 @@
+"""The in-memory leaderboard and the dashboard's role-scoped top students."""
+
+import testbed
+
+
+def award(client, headers, student_id: int, coins: int):
+    client.post("/api/scores/", params={"coins": coins},
+                json={"date": "2024-05-01", "value": 5, "student_id": student_id}, headers=headers).raise_for_status()
+
+
+def test_ranking_follows_coin_awards(backend, client, admin, centre):
+    first, second, third = centre["student_ids"][:3]
+    award(client, admin, second, 30)
+    award(client, admin, third, 20)
+    award(client, admin, first, 10)
+    top = client.get("/api/student/top/", params={"limit": 3}, headers=admin).json()
+    assert [student["id"] for student in top] == [second, third, first]
+
+    client.post("/api/scores/bulk/", json={"date": "2024-05-02", "records": [
+        {"student_id": first, "value": 5, "coins": 25},
+    ]}, headers=admin).raise_for_status()
+    top = client.get("/api/student/top/", params={"limit": 2}, headers=admin).json()
+    assert [(student["id"], student["coins"]) for student in top] == [(first, 35), (second, 30)]
+
+
+def test_leaderboard_matches_database(backend, client, admin, centre):
+    for student_id in centre["student_ids"]:
+        award(client, admin, student_id, student_id % 7)
+    in_memory = client.get("/api/student/top/", params={"limit": 100}, headers=admin).json()
+    backend.init_leaderboard()
+    assert client.get("/api/student/top/", params={"limit": 100}, headers=admin).json() == in_memory
+
+
+def test_late_snapshot_does_not_undo_an_award(backend, client, admin, centre):
+    student_id = centre["student_ids"][0]
+    # Read before the award but applied after it, like a slow cluster poll
+    stale = dict(backend.leaderboard.get(student_id))
+    award(client, admin, student_id, 40)
+    backend.leaderboard.upsert(stale)
+    assert backend.leaderboard.get(student_id)["coins"] == 40
+
+    award(client, admin, student_id, 5)
+    assert backend.leaderboard.get(student_id)["coins"] == 45
+
+
+def test_top_of_groups_merges_group_rankings(backend, centre):
+    group_ids = centre["group_ids"]
+    merged = backend.leaderboard.top_of_groups(4, group_ids)
+    expected = sorted(
+        (student for group_id in group_ids for student in backend.leaderboard.top(100, group_id)),
+        key=lambda student: (-student["coins"], student["id"]),
+    )[:4]
+    assert merged == expected
+
+
+def test_dashboard_top_students_are_scoped(backend, client, admin, mentor):
+    # An admin-only group outside mentor1's groups holds the richest student
+    db = backend.SessionLocal()
+    other = backend.GroupDB(name="Not mentor1's", mentor_id=1, schedule="Sun")
+    db.add(other)
+    db.flush()
+    rich = backend.StudentDB(name="Rich", group_id=other.id, coins=10_000, phone="+998909999999")
+    db.add(rich)
+    db.commit()
+    rich_id = rich.id
+    db.close()
+    backend.init_leaderboard()
+
+    admin_top = client.get("/api/dashboard/", headers=admin).json()["top_students"]
+    mentor_top = client.get("/api/dashboard/", headers=mentor).json()["top_students"]
+    assert admin_top[0]["id"] == rich_id
+    assert rich_id not in [student["id"] for student in mentor_top]
+    assert all(set(student) == {"id", "name", "group_id", "coins"} for student in admin_top + mentor_top)
+
+
+def test_student_dashboard_ranks_own_group(backend, client, admin, centre):
+    group_id = centre["group_ids"][1]
+    client.post("/api/student/", json={"name": "Me", "group_id": group_id, "username": "me", "password": "me12345"},
+                headers=admin).raise_for_status()
+    top = client.get("/api/dashboard/", headers=testbed.auth_headers(client, "me", "me12345")).json()["top_students"]
+    assert top and {student["group_id"] for student in top} == {group_id}
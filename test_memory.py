@@ -0,0 +1,28 @@
+"""An in-memory database serves concurrent reads and writes like a database file."""
+
+import asyncio
+
+import httpx
+
+BACKEND_ENV = {"DATABASE_URL": "sqlite://"}
+
+
+def test_concurrent_requests(backend, client, admin, centre):
+    student_ids = centre["student_ids"]
+
+    async def request_all():
+        transport = httpx.ASGITransport(app=backend.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            requests = []
+            for n in range(30):
+                requests.append(client.get("/api/student/", headers=admin))
+                requests.append(client.get("/api/dashboard/", headers=admin))
+                requests.append(client.post("/api/attendance/", headers=admin, json={
+                    "date": "2024-03-04", "present": n % 2 == 0, "student_id": student_ids[n % len(student_ids)]
+                }))
+            return await asyncio.gather(*requests)
+
+    assert {response.status_code for response in asyncio.run(request_all())} == {200}
+    # Every write landed in the one database
+    marks = client.get("/api/attendance/", params={"group_id": centre["group_ids"][0]}, headers=admin).json()
+    assert len(marks) == 3
@@ -0,0 +1,74 @@
+"""The attendance and score rollups stay equal to a rebuild from the raw rows."""
+
+import asyncio
+
+import httpx
+from sqlalchemy import select
+
+
+def rollups(backend, connection):
+    return (
+        connection.execute(select(backend.AttendanceDailyDB.__table__).order_by("group_id", "date")).all(),
+        connection.execute(select(backend.ScoreMonthlyDB.__table__).order_by("student_id", "month")).all(),
+    )
+
+
+def assert_rollups_match_rebuild(backend):
+    with backend.engine.connect() as connection:
+        maintained = rollups(backend, connection)
+        backend.rebuild_rollups(connection)
+        rebuilt = rollups(backend, connection)
+        connection.rollback()
+    assert maintained == rebuilt
+
+
+def test_attendance_writes_and_corrections(backend, client, admin, centre):
+    group_id = centre["group_ids"][0]
+    students = centre["student_ids"][:3]
+    for student_id in students:
+        client.post("/api/attendance/", json={"date": "2024-04-01", "present": True, "student_id": student_id},
+                    headers=admin).raise_for_status()
+    # Re-marking corrects the existing mark
+    client.post("/api/attendance/", json={"date": "2024-04-01", "present": False, "student_id": students[0]},
+                headers=admin).raise_for_status()
+    client.post("/api/attendance/bulk/", json={"group_id": group_id, "date": "2024-04-01", "records": [
+        {"student_id": students[1], "present": False},
+        {"student_id": students[2], "present": True},
+    ]}, headers=admin).raise_for_status()
+    client.post("/api/attendance/bulk/", json={"group_id": group_id, "date": "2024-04-02", "records": [
+        {"student_id": student_id, "present": True} for student_id in students
+    ]}, headers=admin).raise_for_status()
+    assert_rollups_match_rebuild(backend)
+
+    stats = client.get("/api/analytics/attendance/", params={"by": "group", "group_id": group_id}, headers=admin).json()
+    assert [(row["total"], row["present"]) for row in stats] == [(6, 4)]
+
+
+def test_concurrent_marks_for_one_day(backend, admin, centre):
+    group_id = centre["group_ids"][0]
+    student_id = centre["student_ids"][0]
+
+    async def post_all():
+        transport = httpx.ASGITransport(app=backend.app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+            marks = [client.post("/api/attendance/", headers=admin, json={
+                "date": "2024-04-08", "present": n % 3 != 0, "student_id": student_id
+            }) for n in range(8)]
+            roll_calls = [client.post("/api/attendance/bulk/", headers=admin, json={
+                "group_id": group_id, "date": "2024-04-08",
+                "records": [{"student_id": other, "present": True} for other in centre["student_ids"][:3]]
+            }) for _ in range(4)]
+            return await asyncio.gather(*marks, *roll_calls)
+
+    assert [response.status_code for response in asyncio.run(post_all())] == [200] * 12
+    assert_rollups_match_rebuild(backend)
+
+
+def test_score_writes(backend, client, admin, centre):
+    first, second = centre["student_ids"][:2]
+    client.post("/api/scores/", json={"date": "2024-04-03", "value": 8, "student_id": first}, headers=admin).raise_for_status()
+    client.post("/api/scores/bulk/", json={"date": "2024-05-03", "records": [
+        {"student_id": first, "value": 6},
+        {"student_id": second, "value": 9},
+    ]}, headers=admin).raise_for_status()
+    assert_rollups_match_rebuild(backend)
@@ -0,0 +1,48 @@
+"""Ranked student search over names, phones and usernames."""
+
+import pytest
+
+
+@pytest.fixture(scope="module")
+def students(backend, client, admin):
+    ids = {}
+    for name, phone, parent_phone, username in [
+        ("Oʻtkir Karimov", "+998 90 123 45 67", None, None),
+        ("Karim Otabekov", None, "+998 91 765 43 21", "karim"),
+        ("Dilnoza Karimova", None, None, None),
+    ]:
+        body = {"name": name, "phone": phone, "parent_phone": parent_phone}
+        if username:
+            body.update(username=username, password="secret1")
+        ids[name] = client.post("/api/student/", json=body, headers=admin).json()["id"]
+    return ids
+
+
+def search(client, headers, q: str, **params) -> list:
+    response = client.get("/api/student/search/", params={"q": q, **params}, headers=headers)
+    response.raise_for_status()
+    return [student["name"] for student in response.json()]
+
+
+def test_word_prefixes_match(client, admin, students):
+    assert set(search(client, admin, "kari")) == {"Oʻtkir Karimov", "Karim Otabekov", "Dilnoza Karimova"}
+    assert search(client, admin, "dil kar") == ["Dilnoza Karimova"]
+
+
+def test_whole_word_matches_rank_first(client, admin, students):
+    assert search(client, admin, "karim")[0] == "Karim Otabekov"
+
+
+def test_apostrophes_are_ignored(client, admin, students):
+    assert search(client, admin, "otkir") == ["Oʻtkir Karimov"]
+
+
+def test_phone_numbers_match_in_any_format(client, admin, students):
+    assert search(client, admin, "901234567") == ["Oʻtkir Karimov"]
+    assert search(client, admin, "+998 91 765-43-21") == ["Karim Otabekov"]
+
+
+def test_paging(client, admin, students):
+    first = search(client, admin, "kari", limit=2)
+    rest = search(client, admin, "kari", limit=2, offset=2)
+    assert len(first) == 2 and len(rest) == 1 and not set(first) & set(rest)
@@ -0,0 +1,14 @@
+"""Several worker processes writing to one SQLite file lose no request and no coin award."""
+
+import argparse
+
+import stresstest
+
+BACKEND_ENV = {"SQLITE_PROFILE": "production"}
+
+
+def test_concurrent_workers_award_every_coin(backend):
+    args = argparse.Namespace(workers=3, rounds=4, concurrency=5, students=20)
+    failures, awarded, expected = stresstest.stress(backend, args)
+    assert failures == 0
+    assert awarded == expected